@@ -40,19 +40,38 @@ navLinks.forEach((link) => {
 // Section Animation on Scroll
 const sections = document.querySelectorAll(".section");
 
-const checkSectionVisibility = () => {
-  sections.forEach((section) => {
-    const sectionTop = section.getBoundingClientRect().top;
-    const windowHeight = window.innerHeight;
+if ("IntersectionObserver" in window) {
+  // Let the browser tell us when a section comes into view instead of
+  // re-measuring every section on every scroll event
+  const sectionObserver = new IntersectionObserver(
+    (entries) => {
+      entries.forEach((entry) => {
+        if (entry.isIntersecting) {
+          entry.target.classList.add("active");
+          sectionObserver.unobserve(entry.target);
+        }
+      });
+    },
+    { rootMargin: "0px 0px -15% 0px" }
+  );
 
-    if (sectionTop < windowHeight * 0.85) {
-      section.classList.add("active");
-    }
-  });
-};
+  sections.forEach((section) => sectionObserver.observe(section));
+} else {
+  // Fallback for older browsers without IntersectionObserver
+  const checkSectionVisibility = () => {
+    // Read the viewport height once per pass, not once per section
+    const revealThreshold = window.innerHeight * 0.85;
+
+    sections.forEach((section) => {
+      if (section.getBoundingClientRect().top < revealThreshold) {
+        section.classList.add("active");
+      }
+    });
+  };
 
-window.addEventListener("scroll", checkSectionVisibility);
-window.addEventListener("load", checkSectionVisibility);
+  window.addEventListener("scroll", checkSectionVisibility);
+  window.addEventListener("load", checkSectionVisibility);
+}
 
 // Page-specific functionality
 if (document.body.classList.contains("home")) {
@@ -68,15 +87,6 @@ if (document.body.classList.contains("home")) {
 // Back to Top Button Functionality
 const backToTopButton = document.getElementById("backToTop");
 
-// Show/hide back to top button based on scroll position
-window.addEventListener("scroll", () => {
-  if (window.pageYOffset > 300) {
-    backToTopButton.classList.add("visible");
-  } else {
-    backToTopButton.classList.remove("visible");
-  }
-});
-
 // Smooth scroll to top when button is clicked
 backToTopButton.addEventListener("click", () => {
   window.scrollTo({
@@ -150,72 +160,69 @@ if (contactForm) {
 }
 
 // Custom Dialog Functions
+let successDialog = null;
+
 function showSuccessDialog(userName) {
-  // Create dialog HTML
-  const dialogHTML = `
+  // Build the dialog once and reuse it for later submissions
+  if (!successDialog) {
+    const dialogHTML = `
     <div class="dialog-overlay" id="successDialog">
       <div class="dialog-box">
         <button class="dialog-close" onclick="closeSuccessDialog()">&times;</button>
         <div class="dialog-content">
-          <h3 class="dialog-title">Thank you <span class="dialog-name">${userName}</span>!</h3>
+          <h3 class="dialog-title">Thank you <span class="dialog-name"></span>!</h3>
           <p class="dialog-message">We'll reach out to you shortly!</p>
         </div>
       </div>
     </div>
   `;
 
-  // Add dialog to body
-  document.body.insertAdjacentHTML("beforeend", dialogHTML);
-
-  // Show dialog with animation
-  setTimeout(() => {
-    document.getElementById("successDialog").classList.add("active");
-  }, 10);
+    document.body.insertAdjacentHTML("beforeend", dialogHTML);
+    successDialog = document.getElementById("successDialog");
 
-  // Close dialog when clicking overlay
-  document
-    .getElementById("successDialog")
-    .addEventListener("click", function (e) {
+    // Close dialog when clicking overlay
+    successDialog.addEventListener("click", function (e) {
       if (e.target === this) {
         closeSuccessDialog();
       }
     });
+  }
+
+  successDialog.querySelector(".dialog-name").textContent = userName;
+
+  // Show dialog with animation
+  setTimeout(() => {
+    successDialog.classList.add("active");
+  }, 10);
 }
 
 function closeSuccessDialog() {
-  const dialog = document.getElementById("successDialog");
-  if (dialog) {
-    dialog.classList.remove("active");
-    setTimeout(() => {
-      dialog.remove();
-    }, 300);
+  if (successDialog) {
+    successDialog.classList.remove("active");
   }
 }
 
 // Mobile Optimizations
 document.addEventListener("DOMContentLoaded", function () {
   // Prevent zoom on iOS when focusing inputs
+  const viewportMeta = document.querySelector("meta[name=viewport]");
   const inputs = document.querySelectorAll("input, select, textarea");
   inputs.forEach((input) => {
     input.addEventListener("focus", function () {
       if (window.innerWidth <= 768) {
-        document
-          .querySelector("meta[name=viewport]")
-          .setAttribute(
-            "content",
-            "width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no"
-          );
+        viewportMeta.setAttribute(
+          "content",
+          "width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no"
+        );
       }
     });
 
     input.addEventListener("blur", function () {
       if (window.innerWidth <= 768) {
-        document
-          .querySelector("meta[name=viewport]")
-          .setAttribute(
-            "content",
-            "width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no"
-          );
+        viewportMeta.setAttribute(
+          "content",
+          "width=device-width, initial-scale=1.0, maximum-scale=1.0, user-scalable=no"
+        );
       }
     });
   });
@@ -325,16 +332,27 @@ window.addEventListener("orientationchange", function () {
   }, 100);
 });
 
-// Optimize scroll performance on mobile
+// Coalesce scroll work into one rAF-throttled handler
 let ticking = false;
+let backToTopVisible = false;
 function updateScrollElements() {
-  // Your scroll-based animations here
+  // Show/hide back to top button, touching the DOM only when the
+  // visibility actually changes
+  const shouldShow = window.pageYOffset > 300;
+  if (shouldShow !== backToTopVisible) {
+    backToTopButton.classList.toggle("visible", shouldShow);
+    backToTopVisible = shouldShow;
+  }
   ticking = false;
 }
 
-window.addEventListener("scroll", function () {
-  if (!ticking) {
-    requestAnimationFrame(updateScrollElements);
-    ticking = true;
-  }
-});
+window.addEventListener(
+  "scroll",
+  function () {
+    if (!ticking) {
+      requestAnimationFrame(updateScrollElements);
+      ticking = true;
+    }
+  },
+  { passive: true }
+);
@@ -11,6 +11,7 @@ class MobileOptimizer {
     this.optimizeForMobile();
     this.handleOrientationChange();
     this.preloadCriticalImages();
+    this.setupAdvancedLazyLoading();
   }
 
   detectDevice() {
@@ -59,15 +60,22 @@ class MobileOptimizer {
     let vh = window.innerHeight * 0.01;
     document.documentElement.style.setProperty('--vh', `${vh}px`);
 
+    let vhUpdateQueued = false;
     window.addEventListener('resize', () => {
-      vh = window.innerHeight * 0.01;
-      document.documentElement.style.setProperty('--vh', `${vh}px`);
+      // Coalesce bursts of resize events into one update per frame
+      if (vhUpdateQueued) return;
+      vhUpdateQueued = true;
+      requestAnimationFrame(() => {
+        vh = window.innerHeight * 0.01;
+        document.documentElement.style.setProperty('--vh', `${vh}px`);
+        vhUpdateQueued = false;
+      });
     });
 
     // Prevent zoom on double tap
     let lastTouchEnd = 0;
     document.addEventListener('touchend', function (event) {
-      const now = (new Date()).getTime();
+      const now = Date.now();
       if (now - lastTouchEnd <= 300) {
         event.preventDefault();
       }
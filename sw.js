@@ -91,29 +91,33 @@ self.addEventListener('fetch', event => {
     return;
   }
   
-  // Handle other assets
+  // Handle other assets - stale-while-revalidate
   event.respondWith(
     caches.match(event.request)
       .then(response => {
-        // Return cached version if available
-        if (response) {
-          console.log('Serving from cache:', url.pathname);
-          return response;
-        }
-        
-        // Fetch from network and cache if it's a critical asset
-        return fetch(event.request)
-          .then(response => {
+        // Always kick off a network fetch so the cache stays fresh
+        const networkFetch = fetch(event.request)
+          .then(networkResponse => {
             // Only cache successful responses for same origin
-            if (response.status === 200 && url.origin === location.origin) {
-              const responseClone = response.clone();
+            if (networkResponse.status === 200 && url.origin === location.origin) {
+              const responseClone = networkResponse.clone();
               caches.open(CACHE_NAME)
                 .then(cache => {
                   cache.put(event.request, responseClone);
                 });
             }
-            return response;
+            return networkResponse;
           });
+
+        // Return cached version immediately if available,
+        // letting the background fetch refresh it for next time
+        if (response) {
+          console.log('Serving from cache:', url.pathname);
+          networkFetch.catch(() => {});
+          return response;
+        }
+
+        return networkFetch;
       })
       .catch(error => {
         console.error('Fetch failed:', error);